@@ -1,33 +1,95 @@
 """Async HTTP client wrapping the ai-hub API."""
 
-import httpx
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from importlib.util import find_spec
+
+try:
+    import httpxr as httpx  # Rust-backed, API-compatible port of httpx
+except ImportError:
+    import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+HTTPError = httpx.HTTPError
+
+# httpx only speaks HTTP/2 with the optional h2 package; environments that
+# predate the httpx[http2] requirement fall back to HTTP/1.1 keep-alive.
+HTTP2 = httpx.__name__ == "httpxr" or find_spec("h2") is not None
+
+CATEGORIES_TTL = 300.0  # seconds; the category list changes at most hourly
 
 
 class GloriaClient:
     """Thin async wrapper around ai-hub REST endpoints."""
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        auth_header: bool = False,
+        transport: "httpx.AsyncBaseTransport | None" = None,
+    ):
         self._base_url = base_url.rstrip("/")
         self._token = token
+        # ai-hub historically takes the token as a query param; with
+        # auth_header it is set once on the pooled client as a Bearer header.
+        self._auth_header = auth_header
+        self._base_params = {} if auth_header else {"token": token}
+        self._transport = transport
         self._http: httpx.AsyncClient | None = None
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._cats_cache: tuple[float, list[dict]] | None = None
+        self._cats_lock = asyncio.Lock()
 
     async def _client(self) -> httpx.AsyncClient:
         if self._http is None or self._http.is_closed:
             self._http = httpx.AsyncClient(
                 base_url=self._base_url,
                 timeout=30.0,
+                headers={"Authorization": f"Bearer {self._token}"} if self._auth_header else None,
+                http2=HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+                transport=self._transport,
             )
         return self._http
 
     async def _get(self, path: str, params: dict | None = None) -> dict | list:
+        """GET with single-flight: identical in-flight requests share one call.
+
+        The fetch runs in its own task and every caller awaits it through
+        asyncio.shield, so cancelling any one caller never cancels the request
+        for the others.
+        """
+        key = (path, tuple(sorted(params.items())) if params else ())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(path, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._fetch_done(key, t))
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved in case every caller was cancelled
+
+    async def _fetch(self, path: str, params: dict | None = None) -> dict | list:
         client = await self._client()
-        params = params or {}
-        params["token"] = self._token
-        resp = await client.get(path, params=params)
+        merged = self._base_params if params is None else {**self._base_params, **params}
+        resp = await client.get(path, params=merged)
         if resp.status_code == 404:
             return None
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
 
     async def get_news(
         self,
@@ -35,12 +97,39 @@ class GloriaClient:
         keyword: str | None = None,
         limit: int = 5,
     ) -> list[dict]:
-        params: dict = {"limit": limit, "page": 1}
-        if category:
-            params["feed_categories"] = category
-        if keyword:
-            params["keyword"] = keyword
-        return await self._get("/news", params)
+        """A 404 from /news means no matching items and yields an empty list."""
+        return await self._get("/news", _news_params(category, keyword, limit)) or []
+
+    async def get_news_stream(
+        self,
+        category: str | None = None,
+        keyword: str | None = None,
+        limit: int = 5,
+    ) -> AsyncIterator[dict]:
+        """Yield news items as they arrive.
+
+        Asks for NDJSON and decodes it line by line when the upstream honours
+        that; otherwise the JSON array is buffered and decoded in one go, so
+        items only arrive incrementally from an NDJSON-capable upstream. Like
+        get_news, a 404 means no items.
+        """
+        client = await self._client()
+        async with client.stream(
+            "GET",
+            "/news",
+            params={**self._base_params, **_news_params(category, keyword, limit)},
+            headers={"Accept": "application/x-ndjson, application/json"},
+        ) as resp:
+            if resp.status_code == 404:
+                return
+            resp.raise_for_status()
+            if resp.headers.get("content-type", "").startswith("application/x-ndjson"):
+                async for line in resp.aiter_lines():
+                    if line.strip():
+                        yield _loads(line)
+            else:
+                for item in _loads(await resp.aread()):
+                    yield item
 
     async def get_news_by_id(self, news_id: str) -> dict:
         return await self._get(f"/news/{news_id}")
@@ -52,9 +141,27 @@ class GloriaClient:
         })
 
     async def get_categories(self) -> list[dict]:
-        """Public endpoint — no auth needed, but token doesn't hurt."""
-        return await self._get("/available-feed-categories")
+        """Public endpoint — no auth needed, but token doesn't hurt.
+
+        Cached in-process for CATEGORIES_TTL; concurrent callers share one fetch.
+        """
+        async with self._cats_lock:
+            if self._cats_cache and time.monotonic() - self._cats_cache[0] < CATEGORIES_TTL:
+                return self._cats_cache[1]
+            cats = await self._get("/available-feed-categories")
+            if cats is not None:
+                self._cats_cache = (time.monotonic(), cats)
+            return cats
 
     async def close(self):
         if self._http and not self._http.is_closed:
             await self._http.aclose()
+
+
+def _news_params(category: str | None, keyword: str | None, limit: int) -> dict:
+    params: dict = {"limit": limit, "page": 1}
+    if category:
+        params["feed_categories"] = category
+    if keyword:
+        params["keyword"] = keyword
+    return params
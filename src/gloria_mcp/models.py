@@ -1,6 +1,7 @@
 """Response formatting helpers — strip paid fields, build payment instructions."""
 
 from datetime import datetime, timezone
+from operator import itemgetter
 
 X402_BASE = "https://api.itsgloria.ai"
 
@@ -17,10 +18,16 @@ FREE_NEWS_FIELDS = [
     "tweet_url",
 ]
 
+_GET_FREE = itemgetter(*FREE_NEWS_FIELDS)
+
 
 def truncate_news(item: dict) -> dict:
     """Return only free-tier fields from a news item."""
-    return {k: item[k] for k in FREE_NEWS_FIELDS if k in item}
+    try:
+        return dict(zip(FREE_NEWS_FIELDS, _GET_FREE(item)))
+    except KeyError:
+        # Partial record — keep whichever free fields are present.
+        return {k: item[k] for k in FREE_NEWS_FIELDS if k in item}
 
 
 def format_recap(item: dict) -> dict:
@@ -33,7 +40,7 @@ def format_recap(item: dict) -> dict:
     }
 
 
-def enriched_news_payment_info() -> dict:
+def _build_enriched_news_payment_info() -> dict:
     return {
         "payment_required": True,
         "protocol": "x402",
@@ -62,7 +69,7 @@ def enriched_news_payment_info() -> dict:
     }
 
 
-def ticker_summary_payment_info() -> dict:
+def _build_ticker_summary_payment_info() -> dict:
     return {
         "payment_required": True,
         "protocol": "x402",
@@ -83,3 +90,23 @@ def ticker_summary_payment_info() -> dict:
             "network, then retry with the payment proof header."
         ),
     }
+
+
+_ENRICHED = _build_enriched_news_payment_info()
+_TICKER = _build_ticker_summary_payment_info()
+
+
+def enriched_news_payment_info() -> dict:
+    """x402 instructions for enriched news.
+
+    Returns a shared module-level dict; callers must not mutate it.
+    """
+    return _ENRICHED
+
+
+def ticker_summary_payment_info() -> dict:
+    """x402 instructions for ticker summaries.
+
+    Returns a shared module-level dict; callers must not mutate it.
+    """
+    return _TICKER
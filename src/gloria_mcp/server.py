@@ -1,12 +1,16 @@
 """Gloria AI MCP Server — curated crypto news for AI agents."""
 
+import asyncio
+import contextlib
+import logging
 import os
 
+import anyio
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.server import TransportSecuritySettings
 
-from gloria_mcp.client import GloriaClient
+from gloria_mcp.client import GloriaClient, HTTPError
 from gloria_mcp.models import (
     enriched_news_payment_info,
     format_recap,
@@ -16,6 +20,8 @@ from gloria_mcp.models import (
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 mcp = FastMCP(
     "Gloria AI",
     instructions=(
@@ -30,6 +36,14 @@ mcp = FastMCP(
 
 _client: GloriaClient | None = None
 
+CATEGORIES_RESOURCE_TIMEOUT = 3.0  # seconds
+
+# Failures of an upstream fetch that callers degrade around instead of raising.
+_UPSTREAM_ERRORS = (asyncio.TimeoutError, HTTPError, ValueError)
+
+# Last successfully rendered gloria://categories text, served when upstream fails.
+_cats_rendered: str | None = None
+
 
 def _get_client() -> GloriaClient:
     global _client
@@ -38,7 +52,8 @@ def _get_client() -> GloriaClient:
         base_url = os.environ.get("AI_HUB_BASE_URL", "https://ai-hub.cryptobriefing.com")
         if not token:
             raise RuntimeError("GLORIA_API_TOKEN environment variable is required")
-        _client = GloriaClient(base_url, token)
+        auth_header = os.environ.get("AI_HUB_AUTH_HEADER", "").lower() in ("1", "true", "yes")
+        _client = GloriaClient(base_url, token, auth_header=auth_header)
     return _client
 
 
@@ -62,7 +77,7 @@ async def get_latest_news(category: str | None = None, limit: int = 5) -> list[d
     """
     limit = max(1, min(10, limit))
     items = await _get_client().get_news(category=category, limit=limit)
-    return [truncate_news(item) for item in items]
+    return list(map(truncate_news, items))
 
 
 @mcp.tool()
@@ -97,7 +112,7 @@ async def search_news(query: str, limit: int = 5) -> list[dict]:
     """
     limit = max(1, min(5, limit))
     items = await _get_client().get_news(keyword=query, limit=limit)
-    return [truncate_news(item) for item in items]
+    return list(map(truncate_news, items))
 
 
 @mcp.tool()
@@ -192,16 +207,55 @@ async def about() -> str:
 @mcp.resource("gloria://categories")
 async def categories_resource() -> str:
     """Current feed categories with descriptions."""
+    global _cats_rendered
     try:
-        cats = await _get_client().get_categories()
-        lines = ["Available Gloria AI news categories:\n"]
-        for cat in cats:
-            recap = cat.get("recap_timeframe")
-            recap_info = f" (recaps every {recap})" if recap else " (no recaps)"
-            lines.append(f"- {cat['code']}: {cat['name']}{recap_info}")
-        return "\n".join(lines)
+        cats = await asyncio.wait_for(
+            _get_client().get_categories(), CATEGORIES_RESOURCE_TIMEOUT
+        )
+        if cats is not None:
+            lines = ["Available Gloria AI news categories:\n"]
+            for cat in cats:
+                recap = cat.get("recap_timeframe")
+                recap_info = f" (recaps every {recap})" if recap else " (no recaps)"
+                lines.append(f"- {cat['code']}: {cat['name']}{recap_info}")
+            _cats_rendered = "\n".join(lines)
+            return _cats_rendered
+    except _UPSTREAM_ERRORS + (KeyError, TypeError, AttributeError):
+        # Fetch failed or returned a malformed payload. A RuntimeError from
+        # _get_client() (missing GLORIA_API_TOKEN) is a configuration error
+        # and deliberately propagates rather than masquerading as an outage.
+        pass
+    return _cats_rendered or (
+        "Categories temporarily unavailable. Use the get_categories tool instead."
+    )
+
+
+async def _warm_up(client: GloriaClient) -> None:
+    """Open the connection pool and prime the categories cache."""
+    try:
+        await asyncio.wait_for(client.get_categories(), CATEGORIES_RESOURCE_TIMEOUT)
+    except _UPSTREAM_ERRORS as exc:
+        logger.warning("Categories warm-up failed: %r", exc)
     except Exception:
-        return "Categories temporarily unavailable. Use the get_categories tool instead."
+        # Best-effort: unexpected failures surface again on the first real call.
+        logger.exception("Categories warm-up failed unexpectedly")
+
+
+async def _serve(transport: str) -> None:
+    """Run the MCP server with the upstream client open for its whole lifetime."""
+    client = _get_client()
+    # Warm up alongside the transport so a slow upstream never delays startup.
+    warm_up = asyncio.create_task(_warm_up(client))
+    try:
+        if transport == "streamable-http":
+            await mcp.run_streamable_http_async()
+        else:
+            await mcp.run_stdio_async()
+    finally:
+        warm_up.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await warm_up
+        await client.close()
 
 
 def main():
@@ -214,9 +268,14 @@ def main():
             enable_dns_rebinding_protection=True,
             allowed_hosts=["mcp.itsgloria.ai", "localhost", "127.0.0.1"],
         )
-        mcp.run(transport="streamable-http")
+    _get_client()  # fail fast on missing configuration
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        use_uvloop = False
     else:
-        mcp.run()
+        use_uvloop = True
+    anyio.run(_serve, transport, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
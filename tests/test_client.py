@@ -0,0 +1,206 @@
+"""GloriaClient behaviour, with _fetch stubbed out or an httpx.MockTransport."""
+
+import asyncio
+
+from gloria_mcp.client import GloriaClient, httpx  # httpx or httpxr, whichever client uses
+
+
+class StubClient(GloriaClient):
+    def __init__(self):
+        super().__init__("https://example.invalid", "token")
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def _fetch(self, path, params=None):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"path": path, "params": params}
+
+
+def test_identical_requests_share_one_fetch():
+    async def scenario():
+        client = StubClient()
+        tasks = [
+            asyncio.ensure_future(client._get("/recaps", {"feed_category": "bitcoin"}))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*tasks)
+        assert client.calls == 1
+        assert results[0] == results[1] == results[2]
+        assert client._inflight == {}
+
+    asyncio.run(scenario())
+
+
+def test_different_params_fetch_separately():
+    async def scenario():
+        client = StubClient()
+        client.release.set()
+        await asyncio.gather(
+            client._get("/recaps", {"feed_category": "bitcoin"}),
+            client._get("/recaps", {"feed_category": "defi"}),
+        )
+        assert client.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_first_caller_does_not_cancel_followers():
+    async def scenario():
+        client = StubClient()
+        leader = asyncio.ensure_future(client._get("/categories"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(client._get("/categories"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        client.release.set()
+
+        assert await follower == {"path": "/categories", "params": None}
+        assert leader.cancelled()
+        assert client.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_every_caller_leaves_no_stale_entry():
+    async def scenario():
+        client = StubClient()
+        client.error = RuntimeError("upstream down")
+        caller = asyncio.ensure_future(client._get("/categories"))
+        await asyncio.sleep(0)
+        caller.cancel()
+        client.release.set()
+        await asyncio.sleep(0.01)
+        assert client._inflight == {}
+
+    asyncio.run(scenario())
+
+
+def test_errors_propagate_to_every_caller():
+    async def scenario():
+        client = StubClient()
+        client.error = RuntimeError("upstream down")
+        tasks = [asyncio.ensure_future(client._get("/categories")) for _ in range(2)]
+        await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert client.calls == 1
+        assert client._inflight == {}
+
+        client.error = None
+        assert await client._get("/categories") == {"path": "/categories", "params": None}
+        assert client.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_client_builds_with_or_without_h2():
+    async def scenario():
+        client = GloriaClient("https://example.invalid", "token")
+        http = await client._client()
+        assert not http.is_closed
+        await client.close()
+
+    asyncio.run(scenario())
+
+
+def _mock_client(handler, **kwargs) -> GloriaClient:
+    return GloriaClient(
+        "https://example.invalid", "token", transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def _collect_stream(client: GloriaClient, **kwargs) -> list[dict]:
+    async def scenario():
+        try:
+            return [item async for item in client.get_news_stream(**kwargs)]
+        finally:
+            await client.close()
+
+    return asyncio.run(scenario())
+
+
+def test_news_stream_decodes_ndjson():
+    def handler(request):
+        assert "application/x-ndjson" in request.headers["accept"]
+        return httpx.Response(
+            200,
+            content=b'{"id": "1"}\n\n{"id": "2"}\n',
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+    assert _collect_stream(_mock_client(handler)) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_news_stream_falls_back_to_json_array():
+    def handler(request):
+        return httpx.Response(200, json=[{"id": "1"}, {"id": "2"}])
+
+    assert _collect_stream(_mock_client(handler)) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_news_404_means_no_items_on_both_paths():
+    def handler(request):
+        return httpx.Response(404)
+
+    async def buffered():
+        client = _mock_client(handler)
+        try:
+            return await client.get_news()
+        finally:
+            await client.close()
+
+    assert asyncio.run(buffered()) == []
+    assert _collect_stream(_mock_client(handler)) == []
+
+
+def _capture_requests(**kwargs):
+    seen: list = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"feed_category": "bitcoin"})
+
+    return seen, _mock_client(handler, **kwargs)
+
+
+def test_caller_params_are_not_mutated_and_token_sent_once():
+    seen, client = _capture_requests()
+    params = {"feed_category": "bitcoin", "timeframe": "12h"}
+
+    async def scenario():
+        try:
+            await client._get("/recaps", params)
+            await client.get_news(category="bitcoin")
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    assert params == {"feed_category": "bitcoin", "timeframe": "12h"}
+    for request in seen:
+        assert request.url.params.get_list("token") == ["token"]
+        assert "authorization" not in request.headers
+
+
+def test_auth_header_replaces_query_token():
+    seen, client = _capture_requests(auth_header=True)
+
+    async def scenario():
+        try:
+            await client._get("/recaps", {"feed_category": "bitcoin"})
+            await client._get("/available-feed-categories")
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    for request in seen:
+        assert "token" not in request.url.params
+        assert request.headers["authorization"] == "Bearer token"
@@ -0,0 +1,63 @@
+"""gloria://categories resource fallbacks, against an httpx.MockTransport."""
+
+import asyncio
+
+from gloria_mcp import server
+from gloria_mcp.client import GloriaClient, httpx  # httpx or httpxr, whichever client uses
+
+CATEGORIES = [
+    {"code": "bitcoin", "name": "Bitcoin", "recap_timeframe": "8h"},
+    {"code": "rwa", "name": "Real World Assets"},
+]
+
+
+def test_categories_resource_serves_last_good_on_failure(monkeypatch):
+    responses = iter([
+        httpx.Response(200, json=CATEGORIES),
+        httpx.Response(500),
+        httpx.Response(200, content=b"<html>bad gateway</html>"),
+    ])
+    client = GloriaClient(
+        "https://example.invalid",
+        "token",
+        transport=httpx.MockTransport(lambda request: next(responses)),
+    )
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_cats_rendered", None)
+
+    async def scenario():
+        rendered = []
+        try:
+            for _ in range(3):
+                client._cats_cache = None  # bypass the TTL cache to hit upstream each time
+                rendered.append(await server.categories_resource())
+        finally:
+            await client.close()
+        return rendered
+
+    ok, after_500, after_bad_json = asyncio.run(scenario())
+    assert ok == (
+        "Available Gloria AI news categories:\n\n"
+        "- bitcoin: Bitcoin (recaps every 8h)\n"
+        "- rwa: Real World Assets (no recaps)"
+    )
+    assert after_500 == ok
+    assert after_bad_json == ok
+
+
+def test_categories_resource_without_cache_returns_notice(monkeypatch):
+    client = GloriaClient(
+        "https://example.invalid",
+        "token",
+        transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+    )
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_cats_rendered", None)
+
+    async def scenario():
+        try:
+            return await server.categories_resource()
+        finally:
+            await client.close()
+
+    assert asyncio.run(scenario()).startswith("Categories temporarily unavailable")